@@ -5,20 +5,33 @@ A TUI application to browse and install fonts from the ProgrammingFonts reposito
 """
 
 import os
+import json
+import time
+from bisect import bisect_right
+from datetime import datetime
+from email.utils import parsedate_to_datetime
 import sys
 import platform
-import shutil
+import subprocess
+import threading
 import zipfile
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
+from urllib3.util.retry import Retry
 
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, VerticalScroll
-from textual.widgets import Header, Footer, Static, Button, ListView, ListItem, Label, Input
+from textual.widgets import Header, Footer, Static, Button, OptionList, Label, Input
 from textual.binding import Binding
-from textual import events
+from textual import events, work
 from rich.text import Text
 
 
@@ -28,6 +41,62 @@ REPO_NAME = "ProgrammingFonts"
 REPO_BRANCH = "master"
 BASE_URL = f"https://raw.githubusercontent.com/{REPO_OWNER}/{REPO_NAME}/{REPO_BRANCH}/font"
 
+# Font file types downloaded from each font directory
+FONT_EXTENSIONS = ('.ttf', '.otf', '.woff', '.woff2', '.ttc')
+
+# Font file types Windows can load (web fonts are downloaded but not registered)
+WINDOWS_FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Number of font files fetched in parallel per install
+MAX_DOWNLOAD_WORKERS = 8
+
+# Bytes read from the network and written to disk at a time
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Seconds to wait after an install before refreshing the Linux font cache,
+# so several installs in a row share one fc-cache run
+FONT_CACHE_REFRESH_DELAY = 2.0
+
+# On-disk copy of the repository font listing and how long it stays fresh
+CACHE_DIR = Path.home() / ".cache" / "programming-fonts-installer"
+CACHE_FILE = CACHE_DIR / "index.json"
+CACHE_MAX_AGE = 24 * 60 * 60
+
+
+class RateLimitError(Exception):
+    """Raised when the GitHub API rate limit has been exhausted"""
+
+
+class TruncatedListingError(Exception):
+    """Raised when GitHub returns only part of the repository tree"""
+
+
+def _create_session() -> requests.Session:
+    """Create a shared HTTP session with connection pooling and retry backoff"""
+    session = requests.Session()
+    # Rate limit responses (403/429) are not retried: they last until the
+    # limit resets, so backing off only delays the error
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_DOWNLOAD_WORKERS,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared session so TLS connections to GitHub are reused across requests
+_SESSION = _create_session()
+
+# Current operating system, looked up once
+_SYSTEM = platform.system()
+
 # List of all available fonts (from the repository)
 AVAILABLE_FONTS = [
     "3270-font", "agave", "anka-coder", "anonymous-pro", "apl-2741", "apl-385",
@@ -51,61 +120,366 @@ AVAILABLE_FONTS = [
     "Source-Code-Pro", "space", "Triskweline", "Ubuntu-Mono", "Unifont",
     "Victor Mono", "Vintage Fonts Pack"
 ]
+AVAILABLE_FONTS.sort(key=str.lower)
+
+# Information panel text, filled in with the font directory and font name
+INFO_PANEL_TEMPLATE = """[bold cyan]Font Name:[/bold cyan]
+{name}
+
+[bold cyan]Repository:[/bold cyan]
+ProgrammingFonts/ProgrammingFonts
+
+[bold cyan]Installation Location:[/bold cyan]
+{font_dir}
+
+[bold cyan]Font Directory:[/bold cyan]
+{font_dir}{sep}{name}
+
+[bold yellow]Instructions:[/bold yellow]
+1. Click 'Install Font' or press 'i'
+2. Wait for download to complete
+3. After installation, restart applications to use the font
+4. On Linux, font cache will be refreshed automatically
+
+[bold green]Note:[/bold green]
+Font will be installed for the current user only.
+"""
+
+# Lowercase font names for case-insensitive search, aligned with AVAILABLE_FONTS
+_FONTS_LOWER = [font.lower() for font in AVAILABLE_FONTS]
+
+
+def _char_mask(text: str) -> int:
+    """Build a 64-bit bitmap of the characters present in text"""
+    mask = 0
+    for ch in text:
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
+# Character bitmaps used to reject fonts that cannot contain the search term
+_FONT_BLOOM = [_char_mask(font) for font in _FONTS_LOWER]
+
+# All lowercase names joined into one string, and the offset each name starts
+# at (plus an end sentinel), so a full search is a few str.find calls
+_HAYSTACK = "\n".join(_FONTS_LOWER)
+_OFFSETS = [0]
+for _font in _FONTS_LOWER:
+    _OFFSETS.append(_OFFSETS[-1] + len(_font) + 1)
+del _font
+
+
+def _search_fonts(term: str) -> List[int]:
+    """Get the indices of all fonts whose lowercase name contains term"""
+    if not term:
+        return list(range(len(AVAILABLE_FONTS)))
+    if "\n" in term:
+        # Would match across two names in the haystack
+        return []
+    
+    indices = []
+    pos = _HAYSTACK.find(term)
+    while pos != -1:
+        i = bisect_right(_OFFSETS, pos) - 1
+        indices.append(i)
+        # Continue from the start of the next name
+        pos = _HAYSTACK.find(term, _OFFSETS[i + 1])
+    return indices
 
 
 class FontInstaller:
     """Handles font installation for different operating systems"""
     
+    # Font file names keyed by font directory, with the ETag and time of the
+    # last check against GitHub. Persisted to CACHE_FILE between runs.
+    _tree_cache: Optional[Dict[str, List[str]]] = None
+    _tree_etag: Optional[str] = None
+    _tree_checked: float = 0.0
+    
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_font_directory() -> Path:
-        """Get the appropriate font directory for the current OS"""
-        system = platform.system()
-        
-        if system == "Linux":
+        """Get the appropriate font directory for the current OS (computed once)"""
+        if _SYSTEM == "Linux":
             # User fonts directory
             font_dir = Path.home() / ".local" / "share" / "fonts"
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             font_dir = Path.home() / "Library" / "Fonts"
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             # Windows user fonts
             font_dir = Path(os.environ.get("LOCALAPPDATA", "")) / "Microsoft" / "WindowsFonts"
         else:
-            raise RuntimeError(f"Unsupported operating system: {system}")
+            raise RuntimeError(f"Unsupported operating system: {_SYSTEM}")
         
         font_dir.mkdir(parents=True, exist_ok=True)
         return font_dir
     
     @staticmethod
-    def download_font_directory(font_name: str, temp_dir: Path) -> bool:
-        """Download all font files from a font directory in the repository"""
+    def _download(url: str, file_path: Path) -> bool:
+        """Stream a single file to file_path, returning whether it succeeded
+        
+        The file is written to a sibling .part file and only moved over
+        file_path once complete, so a failed download never damages an
+        installed font.
+        """
+        part_path = file_path.with_name(file_path.name + ".part")
         try:
-            # GitHub API to list directory contents
-            api_url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/contents/font/{font_name}"
-            response = requests.get(api_url, timeout=10)
-            
+            with _SESSION.get(url, stream=True, timeout=30) as response:
+                if response.status_code != 200:
+                    return False
+                with open(part_path, "wb") as f:
+                    # Large .ttc collections are written front to back
+                    if hasattr(os, "posix_fadvise"):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(part_path, file_path)
+            return True
+        except (requests.RequestException, OSError):
+            # Don't leave a truncated download behind
+            try:
+                part_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return False
+    
+    @staticmethod
+    def _api_headers() -> Dict[str, str]:
+        """Build GitHub API headers, authenticating when GITHUB_TOKEN is set"""
+        headers = {"Accept": "application/vnd.github+json"}
+        token = os.environ.get("GITHUB_TOKEN")
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        return headers
+    
+    @staticmethod
+    def load_cache() -> None:
+        """Load the font listing saved by a previous run, if any"""
+        try:
+            data = json.loads(CACHE_FILE.read_text())
+            FontInstaller._tree_cache = data["fonts"]
+            FontInstaller._tree_etag = data.get("etag")
+            FontInstaller._tree_checked = float(data.get("last_checked", 0))
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    @staticmethod
+    def _save_cache() -> None:
+        """Write the font listing to disk atomically via a temporary file"""
+        data = {
+            "etag": FontInstaller._tree_etag,
+            "last_checked": FontInstaller._tree_checked,
+            "fonts": FontInstaller._tree_cache,
+        }
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False) as f:
+                json.dump(data, f)
+            os.replace(f.name, CACHE_FILE)
+        except OSError:
+            # The cache is an optimisation only
+            pass
+    
+    @staticmethod
+    def _rate_limit_wait(response: requests.Response) -> str:
+        """Describe when a rate limited request may be retried, or "" if unknown"""
+        # Secondary rate limits only send Retry-After; X-RateLimit-Reset then
+        # refers to the primary quota, so Retry-After takes precedence
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            if retry_after.isdigit():
+                return f", retry in {retry_after} seconds"
+            try:
+                retry_at = parsedate_to_datetime(retry_after).astimezone()
+            except (TypeError, ValueError):
+                return ""
+            return f" until {retry_at:%H:%M:%S}"
+        
+        reset = response.headers.get("X-RateLimit-Reset")
+        if reset and reset.isdigit():
+            return f" until {datetime.fromtimestamp(int(reset)):%H:%M:%S}"
+        return ""
+    
+    @staticmethod
+    def _fetch_tree(etag: Optional[str]) -> Tuple[int, Optional[str], Dict[str, List[str]]]:
+        """Fetch the repository tree once and group font files by directory"""
+        api_url = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/git/trees/{REPO_BRANCH}?recursive=1"
+        headers = FontInstaller._api_headers()
+        if etag:
+            headers["If-None-Match"] = etag
+        
+        with _SESSION.get(api_url, headers=headers, stream=True, timeout=30) as response:
+            if response.status_code in (403, 429) and (
+                response.headers.get("X-RateLimit-Remaining") == "0"
+                or "rate limit" in response.text.lower()
+            ):
+                message = f"GitHub API rate limit exceeded{FontInstaller._rate_limit_wait(response)}"
+                # Authenticated requests already have the higher limit
+                if not os.environ.get("GITHUB_TOKEN"):
+                    message += "; set GITHUB_TOKEN to raise the limit"
+                raise RateLimitError(message)
             if response.status_code != 200:
-                return False
+                return response.status_code, None, {}
             
-            files = response.json()
-            downloaded = False
+            # The tree lists every file in the repository, so parse it as a
+            # stream and keep only the path and type of each entry
+            response.raw.decode_content = True
+            fonts: Dict[str, List[str]] = {}
+            path = entry_type = None
+            try:
+                for prefix, event, value in ijson.parse(response.raw):
+                    if prefix == "tree.item.path":
+                        path = value
+                    elif prefix == "tree.item.type":
+                        entry_type = value
+                    elif prefix == "tree.item" and event == "end_map":
+                        # Only files directly inside font/<name>/ are installed
+                        if entry_type == "blob" and path and path.startswith("font/"):
+                            parts = path.split("/")
+                            if len(parts) == 3 and parts[2].lower().endswith(FONT_EXTENSIONS):
+                                fonts.setdefault(parts[1], []).append(parts[2])
+                        path = entry_type = None
+                    elif prefix == "truncated" and value:
+                        # Fonts missing from a partial listing would look uninstallable
+                        raise TruncatedListingError(
+                            "GitHub returned an incomplete (truncated) repository listing"
+                        )
+            except (urllib3.exceptions.HTTPError, ijson.JSONError) as e:
+                # Reading raw bypasses requests' error wrapping, so a dropped
+                # or truncated response has to be reported as a network error
+                raise requests.ConnectionError(f"Incomplete repository listing: {e}") from e
             
-            for file_info in files:
-                if file_info['type'] == 'file':
-                    file_name = file_info['name']
-                    # Download font files (ttf, otf, woff, woff2, etc.)
-                    if any(file_name.lower().endswith(ext) for ext in ['.ttf', '.otf', '.woff', '.woff2', '.ttc']):
-                        download_url = file_info['download_url']
-                        file_response = requests.get(download_url, timeout=30)
-                        
-                        if file_response.status_code == 200:
-                            file_path = temp_dir / file_name
-                            file_path.write_bytes(file_response.content)
-                            downloaded = True
-            
-            return downloaded
-        except Exception as e:
-            print(f"Error downloading font: {e}")
-            return False
+            return response.status_code, response.headers.get("ETag"), fonts
+    
+    @staticmethod
+    def get_font_tree() -> Dict[str, List[str]]:
+        """Get font file names for every font, checking GitHub at most once per CACHE_MAX_AGE"""
+        if FontInstaller._tree_cache is None:
+            FontInstaller.load_cache()
+        
+        fonts = FontInstaller._tree_cache
+        if fonts is not None and time.time() - FontInstaller._tree_checked < CACHE_MAX_AGE:
+            return fonts
+        
+        try:
+            status, etag, new_fonts = FontInstaller._fetch_tree(
+                FontInstaller._tree_etag if fonts is not None else None
+            )
+        except (requests.RequestException, RateLimitError, TruncatedListingError):
+            # Fall back to a stale listing when offline, rate limited or
+            # given an incomplete listing
+            if fonts is None:
+                raise
+            return fonts
+        
+        if status == 200:
+            FontInstaller._tree_cache = fonts = new_fonts
+            FontInstaller._tree_etag = etag
+        elif fonts is None:
+            raise RuntimeError(f"GitHub API returned status {status}")
+        elif status != 304:
+            # Keep using the stale listing until GitHub answers again
+            return fonts
+        
+        # The listing is new or unchanged (304), either way it is fresh again
+        FontInstaller._tree_checked = time.time()
+        FontInstaller._save_cache()
+        return fonts
+    
+    @staticmethod
+    def download_font_directory(font_name: str, target_dir: Path) -> int:
+        """Download all font files from a font directory in the repository into target_dir
+        
+        Returns the number of files downloaded. Raises RateLimitError or
+        requests.RequestException if the font listing cannot be fetched.
+        """
+        file_names = FontInstaller.get_font_tree().get(font_name)
+        if not file_names:
+            return 0
+        
+        downloads = [
+            (file_name, f"{BASE_URL}/{quote(font_name)}/{quote(file_name)}")
+            for file_name in file_names
+        ]
+        
+        # Fetch files concurrently over the shared session
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            results = executor.map(
+                lambda download: FontInstaller._download(download[1], target_dir / download[0]),
+                downloads
+            )
+            return sum(results)
+    
+    @staticmethod
+    def refresh_font_cache() -> None:
+        """Rebuild the fontconfig cache so newly installed fonts are found (Linux)"""
+        try:
+            subprocess.run(
+                ["fc-cache", "-f"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            # fontconfig is not installed
+            pass
+    
+    @staticmethod
+    def _windows_font_files(target_dir: Path) -> List[Path]:
+        """List the font files in target_dir that Windows can load"""
+        return [
+            font_file for font_file in target_dir.iterdir()
+            if font_file.name.lower().endswith(WINDOWS_FONT_EXTENSIONS)
+        ]
+    
+    @staticmethod
+    def unload_windows_fonts(font_files: List[Path]) -> None:
+        """Release fonts loaded by AddFontResourceW so their files can be replaced (Windows)"""
+        import ctypes
+        
+        gdi32 = ctypes.windll.gdi32
+        for font_file in font_files:
+            # Each AddFontResourceW call adds a reference; drop them all
+            while gdi32.RemoveFontResourceW(str(font_file)):
+                pass
+    
+    @staticmethod
+    def register_windows_fonts(font_files: List[Path]) -> List[Path]:
+        """Make fonts usable immediately and register them for future sessions (Windows)
+        
+        Returns the files Windows could not load, which are left unregistered.
+        """
+        import ctypes
+        import winreg
+        
+        HWND_BROADCAST = 0xFFFF
+        WM_FONTCHANGE = 0x001D
+        SMTO_ABORTIFHUNG = 0x0002
+        
+        gdi32 = ctypes.windll.gdi32
+        user32 = ctypes.windll.user32
+        
+        failed = []
+        # Per-user font registrations map a display name to the font file
+        with winreg.CreateKey(
+            winreg.HKEY_CURRENT_USER,
+            r"Software\Microsoft\Windows NT\CurrentVersion\Fonts"
+        ) as key:
+            for font_file in font_files:
+                # Returns the number of fonts added, 0 if the file can't be loaded
+                if not gdi32.AddFontResourceW(str(font_file)):
+                    failed.append(font_file)
+                    continue
+                kind = "OpenType" if font_file.suffix.lower() == ".otf" else "TrueType"
+                winreg.SetValueEx(
+                    key, f"{font_file.stem} ({kind})", 0, winreg.REG_SZ, str(font_file)
+                )
+        
+        # Tell running applications the font list changed, without waiting
+        # on windows that are not responding
+        user32.SendMessageTimeoutW(
+            HWND_BROADCAST, WM_FONTCHANGE, 0, 0, SMTO_ABORTIFHUNG, 1000, None
+        )
+        return failed
     
     @staticmethod
     def install_font(font_name: str) -> tuple[bool, str]:
@@ -115,44 +489,44 @@ class FontInstaller:
             target_dir = font_dir / font_name
             target_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create temporary directory for downloads
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                # Download font files
-                if not FontInstaller.download_font_directory(font_name, temp_path):
-                    return False, "Failed to download font files"
-                
-                # Copy font files to target directory
-                font_files = list(temp_path.glob("*"))
-                if not font_files:
-                    return False, "No font files found"
-                
-                for font_file in font_files:
-                    if font_file.is_file():
-                        shutil.copy2(font_file, target_dir / font_file.name)
-                
-                # Refresh font cache on Linux
-                if platform.system() == "Linux":
-                    os.system("fc-cache -f -v > /dev/null 2>&1")
-                
-                return True, f"Successfully installed {len(font_files)} font file(s)"
+            # Windows keeps loaded fonts open, so release a previous install
+            # before its files are replaced
+            if _SYSTEM == "Windows":
+                FontInstaller.unload_windows_fonts(FontInstaller._windows_font_files(target_dir))
+            
+            # Download font files straight into the target directory
+            downloaded = FontInstaller.download_font_directory(font_name, target_dir)
+            
+            # Register on Windows so the fonts work without signing out. This
+            # also reloads the previous files if the download failed.
+            if _SYSTEM == "Windows":
+                try:
+                    failed = FontInstaller.register_windows_fonts(
+                        FontInstaller._windows_font_files(target_dir)
+                    )
+                except OSError as e:
+                    if not downloaded:
+                        return False, "Failed to download font files"
+                    return False, f"Installed {downloaded} font file(s), but registering them failed: {str(e)}"
+                if downloaded and failed:
+                    return False, (
+                        f"Installed {downloaded} font file(s), but Windows could not load "
+                        f"{len(failed)} of them: {', '.join(font_file.name for font_file in failed)}"
+                    )
+            
+            if not downloaded:
+                return False, "Failed to download font files"
+            
+            return True, f"Successfully installed {downloaded} font file(s)"
         
+        except RateLimitError as e:
+            return False, str(e)
+        except requests.RequestException as e:
+            return False, f"Network error: {str(e)}"
         except Exception as e:
             return False, f"Installation error: {str(e)}"
 
 
-class FontListItem(ListItem):
-    """Custom list item for fonts"""
-
-    def __init__(self, font_name: str) -> None:
-        super().__init__()
-        self.font_name = font_name
-
-    def compose(self) -> ComposeResult:
-        yield Label(self.font_name)
-
-
 class FontBrowser(App):
     """TUI application for browsing and installing programming fonts"""
 
@@ -224,19 +598,19 @@ class FontBrowser(App):
         text-align: center;
     }
     
-    ListView {
+    OptionList {
         background: $surface;
     }
     
-    ListItem {
+    OptionList > .option-list--option {
         padding: 0 1;
     }
     
-    ListItem:hover {
+    OptionList > .option-list--option-hover {
         background: $boost;
     }
     
-    ListItem.-selected {
+    OptionList > .option-list--option-highlighted {
         background: $accent;
         color: $text;
     }
@@ -255,6 +629,15 @@ class FontBrowser(App):
         super().__init__()
         self.filtered_fonts = AVAILABLE_FONTS.copy()
         self.selected_font = None
+        FontInstaller.load_cache()
+        # Pending fc-cache run, restarted by each install
+        self._fc_cache_timer: Optional[threading.Timer] = None
+        # Set while an install worker is running; only touched on the UI thread
+        self._installing = False
+        # Last search term and the AVAILABLE_FONTS indices it matched
+        self._last_search = ""
+        self._last_indices = list(range(len(AVAILABLE_FONTS)))
+        self._font_dir = FontInstaller.get_font_directory()
     
     def compose(self) -> ComposeResult:
         """Create the layout"""
@@ -265,10 +648,7 @@ class FontBrowser(App):
                 with Vertical(id="left-panel"):
                     yield Label("Search:", classes="info-title")
                     yield Input(placeholder="Type to filter fonts...", id="search-box")
-                    yield ListView(
-                        *[FontListItem(font) for font in self.filtered_fonts],
-                        id="font-list"
-                    )
+                    yield OptionList(*self.filtered_fonts, id="font-list")
                 
                 with Vertical(id="right-panel"):
                     yield Label("Font Information", classes="info-title")
@@ -284,88 +664,105 @@ class FontBrowser(App):
     
     def on_mount(self) -> None:
         """Set up the app when mounted"""
-        font_list = self.query_one("#font-list", ListView)
-        if font_list.children:
-            font_list.index = 0
+        font_list = self.query_one("#font-list", OptionList)
+        if font_list.option_count:
+            font_list.highlighted = 0
             self.update_info_panel(AVAILABLE_FONTS[0])
     
     def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input"""
         if event.input.id == "search-box":
             search_term = event.value.lower()
-            self.filtered_fonts = [
-                font for font in AVAILABLE_FONTS
-                if search_term in font.lower()
-            ]
+            # An extended search term can only narrow the previous matches
+            if search_term.startswith(self._last_search):
+                need = _char_mask(search_term)
+                indices = [
+                    i for i in self._last_indices
+                    if _FONT_BLOOM[i] & need == need and search_term in _FONTS_LOWER[i]
+                ]
+            else:
+                indices = _search_fonts(search_term)
+            self._last_search = search_term
+            
+            if indices == self._last_indices:
+                return
+            
+            self._last_indices = indices
+            self.filtered_fonts = [AVAILABLE_FONTS[i] for i in indices]
             self.refresh_font_list()
     
     def refresh_font_list(self) -> None:
         """Refresh the font list based on current filter"""
-        font_list = self.query_one("#font-list", ListView)
-        font_list.clear()
-        
-        for font in self.filtered_fonts:
-            font_list.append(FontListItem(font))
+        font_list = self.query_one("#font-list", OptionList)
+        # OptionList only renders the rows in view, so replacing the options is cheap
+        font_list.set_options(self.filtered_fonts)
         
         if self.filtered_fonts:
-            font_list.index = 0
+            font_list.highlighted = 0
             self.update_info_panel(self.filtered_fonts[0])
     
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle font selection"""
-        if isinstance(event.item, FontListItem):
-            self.selected_font = event.item.font_name
-            self.update_info_panel(self.selected_font)
+        self.selected_font = self.filtered_fonts[event.option_index]
+        self.update_info_panel(self.selected_font)
     
     def update_info_panel(self, font_name: str) -> None:
         """Update the information panel with font details"""
         info_panel = self.query_one("#info-panel", Static)
-        
-        # Create information text
-        info_text = f"""[bold cyan]Font Name:[/bold cyan]
-{font_name}
-
-[bold cyan]Repository:[/bold cyan]
-ProgrammingFonts/ProgrammingFonts
-
-[bold cyan]Installation Location:[/bold cyan]
-{FontInstaller.get_font_directory()}
-
-[bold cyan]Font Directory:[/bold cyan]
-{FontInstaller.get_font_directory() / font_name}
-
-[bold yellow]Instructions:[/bold yellow]
-1. Click 'Install Font' or press 'i'
-2. Wait for download to complete
-3. After installation, restart applications to use the font
-4. On Linux, font cache will be refreshed automatically
-
-[bold green]Note:[/bold green]
-Font will be installed for the current user only.
-"""
-        
-        info_panel.update(info_text)
+        info_panel.update(
+            INFO_PANEL_TEMPLATE.format(name=font_name, font_dir=self._font_dir, sep=os.sep)
+        )
     
     def action_install(self) -> None:
         """Install the currently selected font"""
         if not self.selected_font:
             self.update_status("Please select a font first", error=True)
             return
+        if self._installing:
+            # Two installs would write the same files at once
+            self.update_status("An installation is already in progress", error=True)
+            return
         
+        self._installing = True
+        self.query_one("#install-btn", Button).disabled = True
         self.update_status(f"Installing {self.selected_font}...")
-        
-        success, message = FontInstaller.install_font(self.selected_font)
-        
+        self.install_in_background(self.selected_font)
+    
+    @work(thread=True, group="install")
+    def install_in_background(self, font_name: str) -> None:
+        """Install a font in a worker thread so the UI keeps responding"""
+        success, message = FontInstaller.install_font(font_name)
+        self.call_from_thread(self.finish_install, success, message)
+    
+    def finish_install(self, success: bool, message: str) -> None:
+        """Report the result of an install (runs on the UI thread)"""
+        self._installing = False
+        self.query_one("#install-btn", Button).disabled = False
         if success:
             self.update_status(f"✓ {message}", error=False)
+            if _SYSTEM == "Linux":
+                self.schedule_font_cache_refresh()
         else:
             self.update_status(f"✗ {message}", error=True)
     
+    def schedule_font_cache_refresh(self) -> None:
+        """Refresh the font cache in the background once installs settle"""
+        if self._fc_cache_timer is not None:
+            self._fc_cache_timer.cancel()
+        # Not a daemon thread, so quitting right after an install still
+        # leaves the refresh to finish
+        self._fc_cache_timer = threading.Timer(
+            FONT_CACHE_REFRESH_DELAY, FontInstaller.refresh_font_cache
+        )
+        self._fc_cache_timer.start()
+    
     def action_refresh(self) -> None:
         """Refresh the font list"""
         search_box = self.query_one("#search-box", Input)
         search_box.value = ""
         self.filtered_fonts = AVAILABLE_FONTS.copy()
+        self._last_search = ""
+        self._last_indices = list(range(len(AVAILABLE_FONTS)))
         self.refresh_font_list()
         self.update_status("Font list refreshed")
     
@@ -376,12 +773,12 @@ Font will be installed for the current user only.
 
     def action_cursor_down(self) -> None:
         """Move cursor down in font list"""
-        font_list = self.query_one("#font-list", ListView)
+        font_list = self.query_one("#font-list", OptionList)
         font_list.action_cursor_down()
 
     def action_cursor_up(self) -> None:
         """Move cursor up in font list"""
-        font_list = self.query_one("#font-list", ListView)
+        font_list = self.query_one("#font-list", OptionList)
         font_list.action_cursor_up()
 
     def on_button_pressed(self, event: Button.Pressed) -> None: